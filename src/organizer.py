@@ -10,8 +10,22 @@ of concerns:
 This separation makes the code more testable and reusable.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+# Resolved once at import rather than on every FileOrganizer() call
+_DEFAULT_DESKTOP = Path.home() / "Desktop"
+
+# Flags for opening a folder so renames can be resolved relative to it
+_DIR_FLAGS = os.O_RDONLY | os.O_DIRECTORY
+
+# Below this many files the thread pool costs more than it saves
+_PARALLEL_MIN_FILES = 16
+_MAX_WORKERS = 8
 
 
 class FileOrganizer:
@@ -23,11 +37,25 @@ class FileOrganizer:
     when the LLM requests tool execution.
     """
 
-    CATEGORIES = {
-        "Images": [".jpg", ".jpeg", ".png", ".gif", ".heic", ".webp"],
-        "Documents": [".pdf", ".doc", ".docx", ".txt", ".pages"],
-        "Videos": [".mp4", ".mov", ".avi"],
-        "Code": [".py", ".js", ".java", ".cpp", ".go"],
+    # Fixed attribute layout: no per-instance __dict__ to probe on attribute access
+    __slots__ = ("desktop_path", "things_folder_path")
+
+    CATEGORIES: Dict[str, FrozenSet[str]] = {
+        "Images": frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".svg", ".heic", ".webp"}),
+        "Documents": frozenset({".pdf", ".doc", ".docx", ".txt", ".rtf", ".pages", ".odt"}),
+        "Spreadsheets": frozenset({".xls", ".xlsx", ".csv", ".numbers", ".ods"}),
+        "Presentations": frozenset({".ppt", ".pptx", ".key", ".odp"}),
+        "Videos": frozenset({".mp4", ".mov", ".avi", ".mkv", ".wmv", ".flv", ".webm"}),
+        "Audio": frozenset({".mp3", ".wav", ".aac", ".flac", ".m4a", ".ogg"}),
+        "Archives": frozenset({".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".dmg"}),
+        "Code": frozenset({".py", ".js", ".java", ".cpp", ".c", ".h", ".swift", ".go", ".rs"}),
+        "Scripts": frozenset({".sh", ".bat", ".ps1", ".zsh", ".fish"}),
+        "Data": frozenset({".json", ".xml", ".yaml", ".yml", ".toml", ".sql"}),
+    }
+
+    # Inverted index of CATEGORIES, built once so lookups are a single dict probe
+    _EXT_TO_CATEGORY: Dict[str, str] = {
+        ext: category for category, extensions in CATEGORIES.items() for ext in extensions
     }
 
     def __init__(self, desktop_path: Optional[str] = None):
@@ -37,9 +65,7 @@ class FileOrganizer:
         Args:
             desktop_path: Optional custom path to organize. Defaults to ~/Desktop
         """
-        if desktop_path is None:
-            desktop_path = str(Path.home() / "Desktop")
-        self.desktop_path = Path(desktop_path)
+        self.desktop_path = _DEFAULT_DESKTOP if desktop_path is None else Path(desktop_path)
         self.things_folder_path = self.desktop_path / "things_from_desktop"
 
     def categorize_file(self, filename: str) -> str:
@@ -57,21 +83,63 @@ class FileOrganizer:
             categorize_file("report.pdf") -> "Documents"
             categorize_file("unknown.xyz") -> "Others"
         """
-        ext = Path(filename).suffix.lower()
+        dot = filename.rfind(".")
+        return self._EXT_TO_CATEGORY.get(filename[dot:].lower(), "Others") if dot >= 0 else "Others"
+
+    def _folder_path(self, folder: str) -> Path:
+        """
+        Resolve a folder name to its path.
+
+        Args:
+            folder: "Desktop" or "things_from_desktop"
+
+        Returns:
+            The Desktop path, or the things_from_desktop path for any other name
+        """
+        return self.desktop_path if folder == 'Desktop' else self.things_folder_path
+
+    def iter_files_by_category(self, folder: str) -> Iterator[Tuple[str, str]]:
+        """
+        Lazily yield the category of each file on the Desktop or things_from_desktop folder.
+
+        Files are yielded as scandir returns them, so callers that only need a
+        count or a single category never build the full grouping.
+
+        Args:
+            folder: "Desktop" or "things_from_desktop"
 
-        for category, extensions in self.CATEGORIES.items():
-            if ext in extensions:
-                return category
+        Yields:
+            (category, filename) tuples, e.g. ("Images", "photo.jpg")
 
-        return "Others"
+        Note:
+            - Ignores hidden files (those starting with ".")
+            - Ignores directories
+            - Yields nothing if folder doesn't exist or isn't a directory
+        """
+        # Hot loop: categorize_file is inlined and lookups are bound to locals
+        ext_map = self._EXT_TO_CATEGORY
+
+        try:
+            entries = os.scandir(self._folder_path(folder))
+        except (FileNotFoundError, NotADirectoryError):
+            return
+
+        # scandir reuses the directory entry's file type instead of a stat per file
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name[0] == "." or not entry.is_file():
+                    continue
+                dot = name.rfind(".")
+                yield ext_map.get(name[dot:].lower(), "Others") if dot >= 0 else "Others", name
 
     def get_files_by_category(self, folder: str) -> Dict[str, List[str]]:
         """
         Group all files on the Desktop or things_from_desktop folder by category.
 
         Returns:
-            Dictionary mapping category names to lists of filenames
-            Example: {"Images": ["photo.jpg", "logo.png"], "Documents": ["report.pdf"]}
+            Dictionary mapping category names to sorted lists of filenames
+            Example: {"Images": ["logo.png", "photo.jpg"], "Documents": ["report.pdf"]}
 
         Note:
             - Ignores hidden files (those starting with ".")
@@ -80,70 +148,101 @@ class FileOrganizer:
         """
         categorized_files: Dict[str, List[str]] = {}
 
-        folder_path = self.desktop_path if folder == 'Desktop' else self.things_folder_path
-
-        if not folder_path.exists():
-            return categorized_files
+        for category, name in self.iter_files_by_category(folder):
+            files = categorized_files.get(category)
+            if files is None:
+                categorized_files[category] = [name]
+            else:
+                files.append(name)
 
-        for item in folder_path.iterdir():
-            if item.is_file() and not item.name.startswith("."):
-                category = self.categorize_file(item.name)
-                if category not in categorized_files:
-                    categorized_files[category] = []
-                categorized_files[category].append(item.name)
+        for files in categorized_files.values():
+            files.sort()
 
         return categorized_files
 
-    def organize_files(self, dry_run: bool = False) -> str:
+    def _move_all(self, folder: str, moves: List[Tuple[str, str]]) -> List[Optional[Exception]]:
         """
-        Organize files into category folders.
+        Move files into their category folders on the Desktop.
+
+        Renames are issued relative to open directory descriptors, so the kernel
+        only resolves each bare filename. Large batches are spread over a thread
+        pool: renames are independent and release the GIL, which helps most on
+        slow (network or FUSE) filesystems.
 
         Args:
-            dry_run: If True, simulates the organization without moving files.
+            folder: Folder the files currently live in ("Desktop" or "things_from_desktop")
+            moves: (category, filename) pairs to move
 
         Returns:
-            A human-readable string describing what happened (or would happen)
+            One entry per move, in order: None on success, otherwise the error
         """
-        categorized = self.get_files_by_category('Desktop')
+        source_path = self._folder_path(folder)
 
-        if not categorized:
-            return "No files to organize on Desktop."
+        with ExitStack() as stack:
+            desk_fd = _open_dir(stack, self.desktop_path)
+            src_fd = desk_fd if source_path == self.desktop_path else _open_dir(stack, source_path)
 
-        message_lines = []
-        total_files = 0
+            category_fds: Dict[str, int] = {}
+            for category, _ in moves:
+                if category not in category_fds:
+                    category_fds[category] = _open_category_dir(stack, desk_fd, category)
 
-        for category, files in categorized.items():
-            if not files:
-                continue
+            names = [name for _, name in moves]
+            dst_fds = [category_fds[category] for category, _ in moves]
+
+            if len(moves) < _PARALLEL_MIN_FILES:
+                return list(map(_safe_rename, names, repeat(src_fd), dst_fds))
+
+            with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+                return list(pool.map(_safe_rename, names, repeat(src_fd), dst_fds))
+
+    def _organize_folder(self, folder: str, dry_run: bool) -> Tuple[List[str], int]:
+        """
+        Move every file in a folder into its category folder on the Desktop.
 
-            category_folder = self.desktop_path / category
+        The folder is scanned once with iter_files_by_category and the
+        collected moves are then handed to _move_all.
 
-            if not dry_run:
-                category_folder.mkdir(exist_ok=True)
+        Args:
+            folder: Folder whose files should be organized ("Desktop" or "things_from_desktop")
+            dry_run: If True, only report where files would go
 
-            for filename in files:
-                source = self.desktop_path / filename
-                destination = category_folder / filename
+        Returns:
+            A tuple of (message lines, number of files moved or to be moved)
+        """
+        moves = list(self.iter_files_by_category(folder))
+        if not moves:
+            return [], 0
 
-                if not dry_run:
-                    try:
-                        source.rename(destination)
-                    except Exception as e:
-                        message_lines.append(f"❌ Error moving {filename}: {e}")
-                        continue
+        errors: List[Optional[Exception]] = [None] * len(moves) if dry_run else self._move_all(folder, moves)
 
-                message_lines.append(f"  • {filename} → {category}/")
-                total_files += 1
+        message_lines: List[str] = []
+        total_files = 0
+        for (category, name), error in zip(moves, errors):
+            if error is not None:
+                message_lines.append(f"❌ Error moving {name}: {error}")
+                continue
+            message_lines.append(f"  • {name} → {category}/")
+            total_files += 1
 
-        mode = "DRY RUN - Preview" if dry_run else "✓ Organization Complete"
-        result = f"{mode}\n\n"
-        result += "\n".join(message_lines)
-        result += f"\n\nTotal: {total_files} files"
+        return message_lines, total_files
+
+    def organize_files(self, dry_run: bool = False) -> str:
+        """
+        Organize files into category folders.
 
-        if dry_run:
-            result += "\n\n*Run with dry_run=false to actually move the files.*"
+        Args:
+            dry_run: If True, simulates the organization without moving files.
+
+        Returns:
+            A human-readable string describing what happened (or would happen)
+        """
+        message_lines, total_files = self._organize_folder('Desktop', dry_run)
+
+        if not message_lines:
+            return "No files to organize on Desktop."
 
-        return result
+        return _format_result(message_lines, total_files, dry_run)
 
     def organize_things_folder(self, dry_run: bool = False) -> str:
         """
@@ -155,45 +254,85 @@ class FileOrganizer:
         Returns:
             A human-readable string describing what happened (or would happen)
         """
-        categorized = self.get_files_by_category('things_from_desktop')
+        message_lines, total_files = self._organize_folder('things_from_desktop', dry_run)
 
-        if not categorized:
+        if not message_lines:
             return "No files to organize in 'things_from_desktop' folder."
 
-        message_lines = []
-        total_files = 0
+        return _format_result(message_lines, total_files, dry_run)
 
-        for category, files in categorized.items():
-            if not files:
-                continue
 
-            category_folder = self.desktop_path / category
+def _open_dir(stack: ExitStack, path: Union[str, Path], dir_fd: Optional[int] = None) -> int:
+    """
+    Open a folder as a descriptor that renames can be resolved against.
 
-            if not dry_run:
-                category_folder.mkdir(exist_ok=True)
+    Args:
+        stack: ExitStack that closes the descriptor on exit
+        path: Folder to open (relative to dir_fd when given)
+        dir_fd: Optional descriptor that path is relative to
 
-            for filename in files:
-                source = self.things_folder_path / filename
-                destination = category_folder / filename
+    Returns:
+        The open directory descriptor
+    """
+    fd = os.open(path, _DIR_FLAGS, dir_fd=dir_fd)
+    stack.callback(os.close, fd)
+    return fd
 
-                if not dry_run:
-                    try:
-                        source.rename(destination)
-                    except Exception as e:
-                        message_lines.append(f"❌ Error moving {filename}: {e}")
-                        continue
 
-                message_lines.append(f"  • {filename} → {category}/")
-                total_files += 1
+def _safe_rename(name: str, src_fd: int, dst_fd: int) -> Optional[Exception]:
+    """
+    Move a file between two open folders, reporting failure instead of raising.
 
-        mode = "DRY RUN - Preview" if dry_run else "✓ Organization Complete"
-        result = f"{mode}\n\n"
-        result += "\n".join(message_lines)
-        result += f"\n\nTotal: {total_files} files"
+    Args:
+        name: Filename to move (kept the same in the destination)
+        src_fd: Descriptor of the folder the file lives in
+        dst_fd: Descriptor of the folder to move it into
 
-        if dry_run:
-            result += "\n\n*Run with dry_run=false to actually move the files.*"
+    Returns:
+        None on success, otherwise the exception that was raised
+    """
+    try:
+        os.replace(name, name, src_dir_fd=src_fd, dst_dir_fd=dst_fd)
+    except Exception as e:
+        return e
+    return None
+
+
+def _open_category_dir(stack: ExitStack, desk_fd: int, category: str) -> int:
+    """
+    Create (if needed) and open a category folder on the Desktop.
 
-        return result
+    Args:
+        stack: ExitStack that closes the descriptor when organizing finishes
+        desk_fd: Descriptor of the Desktop folder
+        category: Name of the category folder
+
+    Returns:
+        A directory descriptor for the category folder
+    """
+    try:
+        os.mkdir(category, dir_fd=desk_fd)
+    except FileExistsError:
+        pass
+    return _open_dir(stack, category, dir_fd=desk_fd)
+
+
+def _format_result(message_lines: List[str], total_files: int, dry_run: bool) -> str:
+    """
+    Build the human-readable summary returned by the organize methods.
+
+    Args:
+        message_lines: One line per file that was (or would be) moved
+        total_files: Number of files moved (or to be moved)
+        dry_run: Whether this was a preview
+
+    Returns:
+        The summary message, joined in one pass
+    """
+    mode = "DRY RUN - Preview" if dry_run else "✓ Organization Complete"
+    parts = [mode, "", *message_lines, "", f"Total: {total_files} files"]
 
+    if dry_run:
+        parts += ["", "*Run with dry_run=false to actually move the files.*"]
 
+    return "\n".join(parts)
@@ -12,8 +12,6 @@ Key MCP Concepts:
 """
 
 import asyncio
-import json
-from pathlib import Path
 
 # MCP SDK imports - these provide the building blocks for creating an MCP server
 from mcp.server import Server  # The main server class
@@ -31,6 +29,64 @@ app = Server("desktop-organizer")
 organizer = FileOrganizer()
 
 
+# The tool list never changes, so build it once at import instead of per request
+_TOOLS: list[Tool] = [
+    Tool(
+        name="list_desktop_files",
+        # Clear description helps the LLM know when to call this tool
+        description="List all files on the Desktop grouped by category (Images, Documents, Videos, etc.)",
+        inputSchema={
+            "type": "object",
+            "properties": {},  # No parameters needed for this tool
+        },
+    ),
+    Tool(
+        name="organize_desktop",
+        description="Organize Desktop files by moving them into category folders. Use dry_run=true to preview changes without moving files.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "If true, preview changes without actually moving files",
+                    "default": False,
+                },
+            },
+            # Note: dry_run is optional, so no "required" field
+        },
+    ),
+    Tool(
+        name="get_file_category",
+        description="Get the category for a specific file based on its extension",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The filename to categorize",
+                },
+            },
+            # This parameter is required - the LLM must provide it
+            "required": ["filename"],
+        },
+    ),
+    Tool(
+        name="organize_things_from_desktop",
+        description="Organize files from the things_from_desktop folder by moving them into category folders on Desktop",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "If true, preview changes without actually moving files",
+                    "default": False,
+                },
+            },
+        },
+    ),
+]
+
+
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """
@@ -48,62 +104,10 @@ async def list_tools() -> list[Tool]:
 
     Me: Based on a natural language input from the client, the LLM decides which tool 
     best fits?
+
+    The tools themselves are defined once in _TOOLS above.
     """
-    return [
-        Tool(
-            name="list_desktop_files",
-            # Clear description helps the LLM know when to call this tool
-            description="List all files on the Desktop grouped by category (Images, Documents, Videos, etc.)",
-            inputSchema={
-                "type": "object",
-                "properties": {},  # No parameters needed for this tool
-            },
-        ),
-        Tool(
-            name="organize_desktop",
-            description="Organize Desktop files by moving them into category folders. Use dry_run=true to preview changes without moving files.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "dry_run": {
-                        "type": "boolean",
-                        "description": "If true, preview changes without actually moving files",
-                        "default": False,
-                    },
-                },
-                # Note: dry_run is optional, so no "required" field
-            },
-        ),
-        Tool(
-            name="get_file_category",
-            description="Get the category for a specific file based on its extension",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "The filename to categorize",
-                    },
-                },
-                # This parameter is required - the LLM must provide it
-                "required": ["filename"],
-            },
-        ),
-        Tool(
-            name="organize_things_from_desktop",
-            description="Organize files from the things_from_desktop folder by moving them into category folders on Desktop",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "dry_run": {
-                        "type": "boolean",
-                        "description": "If true, preview changes without actually moving files",
-                        "default": False,
-                    },
-                },
-            },
-        ),
-    ]
+    return _TOOLS
 
 
 @app.call_tool()
@@ -131,7 +135,8 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
     if name == "list_desktop_files":
         # Call our organizer to get files grouped by category
-        categorized = organizer.get_files_by_category()
+        # File system work runs in a worker thread so the event loop stays responsive
+        categorized = await asyncio.to_thread(organizer.get_files_by_category, 'Desktop')
 
         if not categorized:
             # Return a TextContent object - this is what the LLM will see
@@ -141,18 +146,18 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             )]
 
         # Format the results in a nice way for the LLM to read and present to user
-        result = "Desktop Files by Category:\n\n"
+        # Collect fragments and join once - repeated += is quadratic in file count
+        parts = ["Desktop Files by Category:", ""]
         total_files = 0
 
-        for category in sorted(categorized.keys()):
-            files = categorized[category]
-            result += f"**{category}** ({len(files)} files):\n"
-            for file in sorted(files):
-                result += f"  - {file}\n"
-            result += "\n"
+        # File lists come back already sorted from the organizer
+        for category, files in sorted(categorized.items()):
+            parts.append(f"**{category}** ({len(files)} files):")
+            parts.extend(f"  - {file}" for file in files)
+            parts.append("")
             total_files += len(files)
 
-        result += f"Total: {total_files} files"
+        result = "\n".join(parts) + f"\nTotal: {total_files} files"
 
         # Always return a list of TextContent objects
         return [TextContent(type="text", text=result)]
@@ -164,7 +169,8 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
         # Execute the file organization (or preview if dry_run=True)
         # SIMPLIFIED: organizer now returns a ready-to-use string message
-        message = organizer.organize_files(dry_run=dry_run)
+        # Moving many files can take a while, so keep it off the event loop
+        message = await asyncio.to_thread(organizer.organize_files, dry_run=dry_run)
 
         # Just pass the message directly to the LLM
         # No need for complex formatting - the organizer handles it
@@ -193,8 +199,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     elif name == "organize_things_from_desktop":
         dry_run = arguments.get("dry_run", False)
 
-        # TODO: Implement organize_things_folder method
-        message = organizer.organize_things_folder(dry_run=dry_run)
+        message = await asyncio.to_thread(organizer.organize_things_folder, dry_run=dry_run)
 
         return [TextContent(type="text", text=message)]
 
@@ -205,6 +210,11 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     )]
 
 
+# Computed after all handlers are registered, since the advertised capabilities
+# depend on which handlers the server has
+_INIT_OPTIONS = app.create_initialization_options()
+
+
 async def main():
     """
     Main entry point for the MCP server.
@@ -225,7 +235,7 @@ async def main():
         await app.run(
             read_stream,   # Where we receive requests from Claude Desktop
             write_stream,  # Where we send responses back to Claude Desktop
-            app.create_initialization_options()  # Server configuration
+            _INIT_OPTIONS  # Server configuration
         )
 
 